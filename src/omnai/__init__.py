@@ -22,27 +22,30 @@ Example:
     ...     print(e)  # Shows suggestions: minimax-m2.1, minimax-m2-api, etc.
 """
 
-from .configs import (
-    # Query functions
-    get_config,
-    list_configs,
-    find_configs,
-    get_default_model,
-    list_engines,
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .configs import (
+        # Query functions
+        get_config,
+        list_configs,
+        find_configs,
+        get_default_model,
+        list_engines,
 
-    # Validation functions
-    find_similar_models,
-    get_model_suggestions,
-    validate_model,
+        # Validation functions
+        find_similar_models,
+        get_model_suggestions,
+        validate_model,
 
-    # Extension API
-    register_config,
-    list_custom_configs,
+        # Extension API
+        register_config,
+        list_custom_configs,
 
-    # Configuration dicts
-    ENGINE_CONFIGS,
-    MODEL_CONFIGS,
-)
+        # Configuration dicts
+        ENGINE_CONFIGS,
+        MODEL_CONFIGS,
+    )
+del TYPE_CHECKING  # Keep the flag out of the package namespace
 
 __version__ = "1.0.0-rc3"
 
@@ -67,3 +70,29 @@ __all__ = [
     "ENGINE_CONFIGS",
     "MODEL_CONFIGS",
 ]
+
+
+# Public names (and the configs submodule itself) are resolved on first
+# access (PEP 562), so `import omnai` does not pay for building the model
+# registry until a config API is actually used.
+def __getattr__(name: str):
+    if name != "configs" and name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import sys
+
+    # Not `from . import configs`: that probes this module's attributes
+    # first, which would re-enter __getattr__("configs")
+    __import__(f"{__name__}.configs")
+    configs = sys.modules[f"{__name__}.configs"]
+
+    if name == "configs":
+        return configs
+
+    value = getattr(configs, name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__) | {"configs"})
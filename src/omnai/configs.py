@@ -6,6 +6,7 @@ quality ratings, and use-case recommendations.
 Architecture:
 - ENGINE_CONFIGS: Registry of supported engines with their characteristics
 - MODEL_CONFIGS: Detailed model configurations with metadata
+- Both registries are read-only; add models with register_config()
 - Query functions: find_configs(), get_config(), list_configs()
 
 Example:
@@ -17,13 +18,88 @@ Example:
     >>> free_coding = find_configs(cost="free", best_for="coding")
 """
 
-from dataclasses import dataclass, field
-from typing import Any, Literal, Optional
+from __future__ import annotations
+
+from collections.abc import Iterator
+from functools import lru_cache
+from itertools import islice
+from threading import Lock
+from types import MappingProxyType
+
+# typing is only needed for annotations; importing it at runtime would add
+# ~10 ms to every one-shot `python3 -c` call that omnai.sh makes. At runtime
+# Any is bound to object instead, so typing.get_type_hints() can still
+# resolve the annotations below (object accepts any value, like Any), and
+# the level aliases are built from _LEVELS on first access (__getattr__).
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any, Literal
+
+    # Type aliases (same values as _LEVELS below)
+    CostLevel = Literal["free", "cheap", "medium", "expensive"]
+    SpeedLevel = Literal["very-fast", "fast", "medium", "slow", "very-slow"]
+    QualityLevel = Literal["excellent", "good", "fair", "basic"]
+else:
+    Any = object
+del TYPE_CHECKING  # Keep the flag out of the module namespace
+
+__all__ = [
+    # Type aliases
+    "CostLevel",
+    "SpeedLevel",
+    "QualityLevel",
+
+    # Query functions
+    "get_config",
+    "list_configs",
+    "find_configs",
+    "get_default_model",
+    "list_engines",
+
+    # Validation functions
+    "find_similar_models",
+    "get_model_suggestions",
+    "validate_model",
+
+    # Extension API
+    "register_config",
+    "list_custom_configs",
+
+    # Configuration dicts
+    "ENGINE_CONFIGS",
+    "MODEL_CONFIGS",
+]
+
+# Valid cost/speed/quality levels, used by find_configs() to reject typos
+# instead of silently matching nothing, and by __getattr__ to build the
+# runtime CostLevel, SpeedLevel and QualityLevel aliases.
+_LEVELS: dict[str, tuple[str, ...]] = {
+    "cost": ("free", "cheap", "medium", "expensive"),
+    "speed": ("very-fast", "fast", "medium", "slow", "very-slow"),
+    "quality": ("excellent", "good", "fair", "basic"),
+}
+
+# Lazily built type aliases (see __getattr__) and the level each one covers
+_LEVEL_ALIASES: dict[str, str] = {
+    "CostLevel": "cost",
+    "SpeedLevel": "speed",
+    "QualityLevel": "quality",
+}
+
+
+# The level aliases are resolved on first access (PEP 562), so importing
+# this module does not import typing until one of them is actually used.
+def __getattr__(name: str) -> Any:
+    field = _LEVEL_ALIASES.get(name)
+    if field is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from typing import Literal
+
+    alias = Literal[_LEVELS[field]]
+    globals()[name] = alias  # Cache so later lookups skip __getattr__
+    return alias
 
-# Type aliases
-CostLevel = Literal["free", "cheap", "medium", "expensive"]
-SpeedLevel = Literal["very-fast", "fast", "medium", "slow", "very-slow"]
-QualityLevel = Literal["excellent", "good", "fair", "basic"]
 
 #------------------------------------------------------------------------------
 # Engine Configurations
@@ -606,84 +682,261 @@ MODEL_CONFIGS = {
     },
 }
 
+
+class _ReadOnlyList(list):
+    """A list that refuses in-place changes (still an instance of list).
+
+    Copying or pickling one yields a plain list, so defensive copies and
+    serialization behave as they would for an ordinary list.
+    """
+
+    def _read_only(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError(f"{type(self).__name__!r} object is read-only")
+
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+
+    def __reduce__(self) -> tuple:
+        return list, (list(self),)
+
+    def __copy__(self) -> list:
+        return list(self)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> list:
+        from copy import deepcopy
+        return deepcopy(list(self), memo)
+
+
+class _ReadOnlyDict(dict):
+    """A dict that refuses in-place changes (still an instance of dict).
+
+    Copying or pickling one yields a plain dict, like _ReadOnlyList.
+    """
+
+    _read_only = _ReadOnlyList._read_only
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self) -> tuple:
+        return dict, (dict(self),)
+
+    def __copy__(self) -> dict:
+        return dict(self)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> dict:
+        from copy import deepcopy
+        return deepcopy(dict(self), memo)
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively make dicts and lists read-only (_ReadOnlyDict/_ReadOnlyList)."""
+    if isinstance(value, (dict, MappingProxyType)):
+        return _ReadOnlyDict({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return _ReadOnlyList(_freeze(item) for item in value)
+    if isinstance(value, tuple):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+# Freeze the built-in registries, nested values included. The lookup
+# indexes below are derived from them once at import, so in-place edits
+# would silently go stale; custom models go through register_config()
+# instead. Entries and their nested values are read-only dict and list
+# subclasses rather than mappingproxies, so query functions can hand out
+# shallow copies that still copy, pickle and JSON-serialize like plain data.
+ENGINE_CONFIGS = MappingProxyType({
+    engine_id: _freeze(config) for engine_id, config in ENGINE_CONFIGS.items()
+})
+MODEL_CONFIGS = MappingProxyType({
+    model_id: _freeze(config) for model_id, config in MODEL_CONFIGS.items()
+})
+
 #------------------------------------------------------------------------------
 # Custom Configs Registry (User-registered models)
 #------------------------------------------------------------------------------
 
+# Entries are stored frozen, with their "id" already filled in; query
+# functions hand out shallow copies
 _CUSTOM_CONFIGS: dict[str, dict[str, Any]] = {}
 
+# Serializes register_config() so concurrent registrations can't interleave
+# their updates to the registry, indexes and caches. The memoized queries
+# also compute under it, so they never walk a half-updated index; plain
+# lookups iterate tuple() snapshots instead of the live dicts.
+_REGISTRY_LOCK = Lock()
+
+# Bumped by _clear_caches() and passed to the memoized queries as part of
+# their cache key, so a result computed before a registration can't be
+# served after it (even if it lands in the cache after the clear)
+_registry_version = 0
+
+#------------------------------------------------------------------------------
+# Lookup Indexes (built once at import, extended by register_config)
+#------------------------------------------------------------------------------
+
+# Canonical engine ID for every engine name and alias ("claude-code" -> "claude")
+_ENGINE_ALIASES: dict[str, str] = {
+    name: engine_id
+    for engine_id, config in ENGINE_CONFIGS.items()
+    for name in (engine_id, *config.get("aliases", ()))
+}
+
+
+def _canonical_engine(engine: str | None) -> str | None:
+    """Resolve an engine alias declared in ENGINE_CONFIGS to its engine ID.
+
+    Unknown names (including None) are returned unchanged.
+    """
+    return _ENGINE_ALIASES.get(engine, engine)
+
+
+# Engine configs with their "id" filled in, as returned by list_engines()
+_ENGINE_CONFIGS_WITH_ID: list[dict[str, Any]] = [
+    {**config, "id": engine_id} for engine_id, config in ENGINE_CONFIGS.items()
+]
+
+# Built-in configs with their "id" filled in, so query functions return one
+# dict copy per result instead of copying and then inserting the key
+_MODEL_CONFIGS_WITH_ID: dict[str, dict[str, Any]] = {
+    model_id: {**config, "id": model_id}
+    for model_id, config in MODEL_CONFIGS.items()
+}
+
+# Built-in configs grouped by engine (in registry order) for list_configs;
+# built-ins never change, so these are never rebuilt
+_MODEL_CONFIGS_BY_ENGINE: dict[str, list[dict[str, Any]]] = {}
+for _config in _MODEL_CONFIGS_WITH_ID.values():
+    _MODEL_CONFIGS_BY_ENGINE.setdefault(_config["engine"], []).append(_config)
+del _config
+
+# Lowercased model IDs for case-insensitive suggestion matching
+_MODEL_IDS_LOWER: dict[str, str] = {
+    model_id: model_id.lower() for model_id in MODEL_CONFIGS
+}
+
+# Position of each model ID in merged order (built-ins first, then custom
+# models in registration order), used to return index hits in a stable order
+_MODEL_POSITIONS: dict[str, int] = {
+    model_id: position for position, model_id in enumerate(MODEL_CONFIGS)
+}
+
+# Inverted indexes for find_configs(): field -> value -> model IDs.
+# They always describe the effective config of each ID (a custom config
+# shadows a built-in one with the same ID).
+_FACET_INDEXES: dict[str, dict[Any, set[str]]] = {
+    "cost": {},
+    "speed": {},
+    "quality": {},
+    "best_for": {},
+    "free_tier": {},
+    "engine": {},
+}
+
+
+def _facet_values(config: dict[str, Any], field: str) -> tuple:
+    """Return the indexable values of a config field (list fields fan out)."""
+    value = config.get(field)
+    if value is None:
+        return ()
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return tuple(value)
+    if field == "engine":
+        return (_canonical_engine(value),)  # Aliases index under their engine
+    return (value,)
+
+
+def _index_config(model_id: str, config: dict[str, Any]) -> None:
+    """Add a model's field values to the facet indexes."""
+    for field, index in _FACET_INDEXES.items():
+        for value in _facet_values(config, field):
+            index.setdefault(value, set()).add(model_id)
+
+
+def _unindex_config(model_id: str, config: dict[str, Any]) -> None:
+    """Remove a model's field values from the facet indexes."""
+    for field, index in _FACET_INDEXES.items():
+        for value in _facet_values(config, field):
+            index.get(value, set()).discard(model_id)
+
+
+for _model_id, _config in MODEL_CONFIGS.items():
+    _index_config(_model_id, _config)
+del _model_id, _config
+
 #------------------------------------------------------------------------------
 # Query Functions
 #------------------------------------------------------------------------------
 
-def get_config(model_id: str) -> Optional[dict[str, Any]]:
+def get_config(model_id: str) -> dict[str, Any] | None:
     """Get configuration for a specific model.
 
     Args:
         model_id: The model identifier
 
     Returns:
-        Model configuration dict with all metadata, or None if not found
+        Model configuration dict with all metadata, or None if not found.
+        The dict is the caller's own, but nested values (best_for,
+        cost_per_mtok) are read-only list/dict subclasses shared with the
+        registry; copy them (list(), dict(), copy.deepcopy()) to edit.
 
     Example:
         >>> config = get_config("gpt-4o")
         >>> print(f"Cost: ${config['cost_per_mtok']['output']}/M output tokens")
     """
-    # Check built-in configs first
-    if model_id in MODEL_CONFIGS:
-        config = MODEL_CONFIGS[model_id].copy()
-        config["id"] = model_id
-        return config
-
-    # Check custom configs
-    if model_id in _CUSTOM_CONFIGS:
-        config = _CUSTOM_CONFIGS[model_id].copy()
-        config["id"] = model_id
-        return config
-
-    return None
+    # Check built-in configs first, then custom configs
+    config = _MODEL_CONFIGS_WITH_ID.get(model_id) or _CUSTOM_CONFIGS.get(model_id)
+    if config is None:
+        return None
+    return config.copy()
 
 
-def list_configs(engine: Optional[str] = None) -> list[dict[str, Any]]:
+def list_configs(engine: str | None = None) -> list[dict[str, Any]]:
     """List all available model configurations, optionally filtered by engine.
 
     Args:
-        engine: Optional engine name to filter by
+        engine: Optional engine name or alias to filter by
 
     Returns:
-        List of model configurations with metadata
+        List of model configurations with metadata (nested values are
+        read-only, as for get_config())
 
     Example:
         >>> ollama_models = list_configs(engine="ollama")
         >>> for model in ollama_models:
         ...     print(f"{model['id']}: {model['notes']}")
     """
-    configs = []
+    return [config.copy() for config in _iter_configs(engine)]
+
+
+def _iter_configs(engine: str | None = None) -> Iterator[dict[str, Any]]:
+    """Yield the registry entries behind list_configs() without copying them.
 
-    # Add built-in configs
-    for model_id, config in MODEL_CONFIGS.items():
-        if engine is None or config["engine"] == engine:
-            model_config = config.copy()
-            model_config["id"] = model_id
-            configs.append(model_config)
+    Callers that only read a few fields (or stop early) can skip building
+    the full list of copies; they must not mutate what they get.
+    """
+    engine = _canonical_engine(engine)
 
-    # Add custom configs
-    for model_id, config in _CUSTOM_CONFIGS.items():
-        if engine is None or config.get("engine") == engine:
-            model_config = config.copy()
-            model_config["id"] = model_id
-            configs.append(model_config)
+    # Built-in configs
+    if engine is None:
+        yield from _MODEL_CONFIGS_WITH_ID.values()
+    else:
+        yield from _MODEL_CONFIGS_BY_ENGINE.get(engine, ())
 
-    return configs
+    # Custom configs (a snapshot: register_config() may add to the live dict)
+    for config in tuple(_CUSTOM_CONFIGS.values()):
+        if engine is None or _canonical_engine(config.get("engine")) == engine:
+            yield config
 
 
 def find_configs(
-    cost: Optional[str | list[str]] = None,
-    speed: Optional[str | list[str]] = None,
-    quality: Optional[str | list[str]] = None,
-    best_for: Optional[str | list[str]] = None,
-    free_tier: Optional[bool] = None,
-    engine: Optional[str | list[str]] = None,
+    cost: str | list[str] | None = None,
+    speed: str | list[str] | None = None,
+    quality: str | list[str] | None = None,
+    best_for: str | list[str] | None = None,
+    free_tier: bool | None = None,
+    engine: str | list[str] | None = None,
 ) -> list[dict[str, Any]]:
     """Find models matching the specified criteria.
 
@@ -695,10 +948,14 @@ def find_configs(
         quality: Quality level(s): excellent, good, fair, basic
         best_for: Use case(s): coding, reasoning, general, etc.
         free_tier: Whether model has free tier access
-        engine: Engine name(s): claude, opencode, ollama, etc.
+        engine: Engine name(s) or aliases: claude, opencode, ollama, etc.
 
     Returns:
-        List of matching model configurations
+        List of matching model configurations (nested values are read-only,
+        as for get_config())
+
+    Raises:
+        ValueError: If a cost, speed or quality value is not a known level
 
     Example:
         >>> # Find free models good for coding
@@ -707,46 +964,125 @@ def find_configs(
         >>> # Find fast, cheap models
         >>> models = find_configs(cost=["free", "cheap"], speed="fast")
     """
-    # Normalize list parameters
-    def normalize(value):
-        if value is None:
-            return None
-        return [value] if isinstance(value, str) else value
-
-    cost_list = normalize(cost)
-    speed_list = normalize(speed)
-    quality_list = normalize(quality)
-    best_for_list = normalize(best_for)
-    engine_list = normalize(engine)
-
-    results = []
-
-    for model_id, config in {**MODEL_CONFIGS, **_CUSTOM_CONFIGS}.items():
-        # Check each criterion
-        if cost_list and config.get("cost") not in cost_list:
-            continue
-        if speed_list and config.get("speed") not in speed_list:
-            continue
-        if quality_list and config.get("quality") not in quality_list:
-            continue
-        if free_tier is not None and config.get("free_tier") != free_tier:
-            continue
-        if engine_list and config.get("engine") not in engine_list:
-            continue
-        if best_for_list:
-            model_use_cases = config.get("best_for", [])
-            if not any(use in model_use_cases for use in best_for_list):
-                continue
-
-        # Model matches all criteria
-        model_config = config.copy()
-        model_config["id"] = model_id
-        results.append(model_config)
-
-    return results
-
-
-def get_default_model(engine: str) -> Optional[str]:
+    if (
+        cost is None and speed is None and quality is None
+        and best_for is None and free_tier is None and engine is None
+    ):
+        # No filters: every model, custom configs replacing built-ins in place
+        if not _CUSTOM_CONFIGS:
+            return [config.copy() for config in _MODEL_CONFIGS_WITH_ID.values()]
+        model_ids = tuple(_MODEL_POSITIONS)
+    else:
+        model_ids = _find_config_ids(
+            _filter_values(cost),
+            _filter_values(speed),
+            _filter_values(quality),
+            _filter_values(best_for),
+            free_tier,
+            _filter_values(engine),
+            _registry_version,
+        )
+
+    return [
+        (_CUSTOM_CONFIGS.get(model_id) or _MODEL_CONFIGS_WITH_ID[model_id]).copy()
+        for model_id in model_ids
+    ]
+
+
+def _filter_values(value: str | list[str] | None) -> frozenset | None:
+    """Normalize a find_configs() criterion to a hashable set (None = any)."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return _single_filter_value(value)
+    return frozenset(value) or None
+
+
+@lru_cache(maxsize=256)
+def _single_filter_value(value: str) -> frozenset:
+    """Shared one-element filter set, so repeated queries reuse its hash."""
+    return frozenset((value,))
+
+
+@lru_cache(maxsize=256)
+def _find_config_ids(
+    cost: frozenset | None,
+    speed: frozenset | None,
+    quality: frozenset | None,
+    best_for: frozenset | None,
+    free_tier: bool | None,
+    engine: frozenset | None,
+    version: int,
+) -> tuple[str, ...]:
+    """Resolve normalized find_configs() criteria to matching model IDs.
+
+    Memoized on the normalized criteria and the registry version; cleared
+    by register_config().
+    """
+    with _REGISTRY_LOCK:
+        return _match_config_ids(cost, speed, quality, best_for, free_tier, engine)
+
+
+def _match_config_ids(
+    cost: frozenset | None,
+    speed: frozenset | None,
+    quality: frozenset | None,
+    best_for: frozenset | None,
+    free_tier: bool | None,
+    engine: frozenset | None,
+) -> tuple[str, ...]:
+    """Uncached body of _find_config_ids(); caller holds _REGISTRY_LOCK."""
+    criteria = (
+        ("cost", cost),
+        ("speed", speed),
+        ("quality", quality),
+        ("best_for", best_for),
+        ("free_tier", None if free_tier is None else (free_tier,)),
+        ("engine", engine and frozenset(map(_canonical_engine, engine))),
+    )
+
+    # Look up each criterion in its inverted index (values within one are ORed)
+    matches = []
+    for field, values in criteria:
+        if values:
+            index = _FACET_INDEXES[field]
+            if field in _LEVELS:
+                _check_levels(field, values, index)
+            matches.append(set().union(*(index.get(value, ()) for value in values)))
+
+    if not matches:
+        return tuple(_MODEL_POSITIONS)
+
+    # Intersect the most selective criteria first and stop once nothing is left
+    matches.sort(key=len)
+    candidates = matches[0]
+    for matched in matches[1:]:
+        if not candidates:
+            break
+        candidates &= matched
+
+    return tuple(sorted(candidates, key=_MODEL_POSITIONS.__getitem__))
+
+
+def _check_levels(field: str, values: frozenset, index: dict[Any, set[str]]) -> None:
+    """Raise ValueError for level values that no model could ever match.
+
+    Known levels are always accepted, as are values some registered
+    config currently uses (custom configs are not validated on register).
+    """
+    levels = _LEVELS[field]
+    unknown = sorted(
+        repr(value) for value in values
+        if value not in levels and not index.get(value)
+    )
+    if unknown:
+        raise ValueError(
+            f"Unknown {field} level: {', '.join(unknown)}. "
+            f"Expected one of: {', '.join(levels)}"
+        )
+
+
+def get_default_model(engine: str) -> str | None:
     """Get the default model for an engine.
 
     Args:
@@ -759,32 +1095,26 @@ def get_default_model(engine: str) -> Optional[str]:
         >>> default = get_default_model("ollama")
         >>> print(default)  # "qwen2.5-coder:7b"
     """
-    # Handle aliases
-    if engine == "claude-code":
-        engine = "claude"
-
-    if engine in ENGINE_CONFIGS:
-        return ENGINE_CONFIGS[engine].get("default_model")
-    return None
+    # Resolve aliases declared in ENGINE_CONFIGS
+    engine_config = ENGINE_CONFIGS.get(_canonical_engine(engine))
+    if engine_config is None:
+        return None
+    return engine_config.get("default_model")
 
 
 def list_engines() -> list[dict[str, Any]]:
     """List all supported engines.
 
     Returns:
-        List of engine configurations with metadata
+        List of engine configurations with metadata (nested values such as
+        aliases are read-only, as for get_config())
 
     Example:
         >>> engines = list_engines()
         >>> for engine in engines:
         ...     print(f"{engine['id']}: {engine['description']}")
     """
-    engines = []
-    for engine_id, config in ENGINE_CONFIGS.items():
-        engine_config = config.copy()
-        engine_config["id"] = engine_id
-        engines.append(engine_config)
-    return engines
+    return [config.copy() for config in _ENGINE_CONFIGS_WITH_ID]
 
 
 #------------------------------------------------------------------------------
@@ -793,7 +1123,7 @@ def list_engines() -> list[dict[str, Any]]:
 
 def find_similar_models(
     model_id: str,
-    engine: Optional[str] = None,
+    engine: str | None = None,
     limit: int = 5
 ) -> list[dict[str, Any]]:
     """Find similar model names for helpful suggestions.
@@ -803,7 +1133,8 @@ def find_similar_models(
 
     Args:
         model_id: The model identifier to search for
-        engine: Optional engine filter (only suggest models for this engine)
+        engine: Optional engine filter (only suggest models for this engine;
+            aliases such as "claude-code" are accepted)
         limit: Maximum number of suggestions to return
 
     Returns:
@@ -817,61 +1148,75 @@ def find_similar_models(
         minimax-m2-api - cheap
     """
     similar = []
-    search_lower = model_id.lower()
-
-    # Search in both built-in and custom configs
-    all_configs = {}
-    for mid, cfg in MODEL_CONFIGS.items():
-        all_configs[mid] = cfg
-    for mid, cfg in _CUSTOM_CONFIGS.items():
-        all_configs[mid] = cfg
-
-    for mid, config in all_configs.items():
-        # Filter by engine if specified
-        if engine and config.get("engine") != engine:
-            continue
-
-        mid_lower = mid.lower()
-
-        # Match strategies (in order of priority):
-        # 1. Exact substring match
-        # 2. Search term is in model ID
-        # 3. Model ID starts with search term
-        # 4. Common prefix (for typos like "minimax-m3" -> "minimax-m2")
-        matched = False
-
-        if search_lower in mid_lower or mid_lower in search_lower:
-            matched = True
-        elif mid_lower.startswith(search_lower) or search_lower.startswith(mid_lower[:len(search_lower)//2] if len(search_lower) > 3 else ""):
-            matched = True
-        else:
-            # Check for common prefix (at least 5 chars)
-            common_len = 0
-            for i, (c1, c2) in enumerate(zip(search_lower, mid_lower)):
-                if c1 == c2:
-                    common_len = i + 1
-                else:
-                    break
-            if common_len >= 5:
-                matched = True
-
-        if matched:
-            similar.append({
-                "id": mid,
-                "full_name": config.get("full_name", mid),
-                "engine": config.get("engine"),
-                "cost": config.get("cost", "unknown"),
-                "speed": config.get("speed", "unknown"),
-                "quality": config.get("quality", "unknown"),
-                "model": config.get("model"),  # Actual model string used
-            })
-
-    return similar[:limit]
+
+    engine = _canonical_engine(engine) or None
+    model_ids = _similar_model_ids(model_id.lower(), engine, _registry_version)
+    for mid in model_ids[:limit]:
+        config = _CUSTOM_CONFIGS.get(mid) or MODEL_CONFIGS[mid]
+        similar.append({
+            "id": mid,
+            "full_name": config.get("full_name", mid),
+            "engine": config.get("engine"),
+            "cost": config.get("cost", "unknown"),
+            "speed": config.get("speed", "unknown"),
+            "quality": config.get("quality", "unknown"),
+            "model": config.get("model"),  # Actual model string used
+        })
+
+    return similar
+
+
+@lru_cache(maxsize=256)
+def _similar_model_ids(
+    search_lower: str, engine: str | None, version: int
+) -> tuple[str, ...]:
+    """IDs matching find_similar_models(), in registry order (memoized).
+
+    Keyed on the registry version and cleared by register_config(); callers
+    build fresh dicts from the IDs.
+    """
+    with _REGISTRY_LOCK:
+        return _match_similar_ids(search_lower, engine)
+
+
+def _match_similar_ids(search_lower: str, engine: str | None) -> tuple[str, ...]:
+    """Uncached body of _similar_model_ids(); caller holds _REGISTRY_LOCK."""
+    # Required shared prefix: half the query (at most 5 chars); queries of
+    # 3 chars or fewer are too short to discriminate, so anything matches.
+    prefix_len = min(len(search_lower) // 2, 5) if len(search_lower) > 3 else 0
+    search_prefix = search_lower[:prefix_len]
+
+    # Search in both built-in and custom configs (custom wins), walking the
+    # merged registry order instead of building a merged dict per call.
+    # An engine filter only visits that engine's models (via its index).
+    if engine:
+        candidates = sorted(
+            _FACET_INDEXES["engine"].get(engine, ()),
+            key=_MODEL_POSITIONS.__getitem__,
+        )
+    else:
+        candidates = _MODEL_POSITIONS
+
+    matches = []
+    for mid in candidates:
+        mid_lower = _MODEL_IDS_LOWER[mid]
+
+        # Match strategies:
+        # 1. Either ID contains the other (covers exact and prefix matches)
+        # 2. Shared leading prefix (for typos like "minimax-m3" -> "minimax-m2")
+        if (
+            search_lower in mid_lower
+            or mid_lower in search_lower
+            or mid_lower.startswith(search_prefix)
+        ):
+            matches.append(mid)
+
+    return tuple(matches)
 
 
 def get_model_suggestions(
-    model_id: Optional[str] = None,
-    engine: Optional[str] = None,
+    model_id: str | None = None,
+    engine: str | None = None,
     limit: int = 10
 ) -> list[dict[str, Any]]:
     """Get model suggestions for interactive selection.
@@ -902,8 +1247,12 @@ def get_model_suggestions(
         # Find similar models (typo correction)
         return find_similar_models(model_id, engine, limit)
     else:
-        # List all models for engine
-        configs = list_configs(engine=engine)
+        # List all models for engine, reading only the first `limit` entries
+        # (None or a negative limit keep their usual slice meaning)
+        if limit is not None and limit >= 0:
+            configs = list(islice(_iter_configs(engine), limit))
+        else:
+            configs = list(_iter_configs(engine))[:limit]
         return [{
             "id": c["id"],
             "full_name": c.get("full_name", c["id"]),
@@ -911,10 +1260,10 @@ def get_model_suggestions(
             "cost": c.get("cost", "unknown"),
             "speed": c.get("speed", "unknown"),
             "quality": c.get("quality", "unknown"),
-        } for c in configs[:limit]]
+        } for c in configs]
 
 
-def validate_model(model_id: str, engine: Optional[str] = None) -> dict[str, Any]:
+def validate_model(model_id: str, engine: str | None = None) -> dict[str, Any]:
     """Validate that a model exists and return its configuration.
 
     Strict validation with helpful error messages and suggestions.
@@ -944,16 +1293,28 @@ def validate_model(model_id: str, engine: Optional[str] = None) -> dict[str, Any
     config = get_config(model_id)
 
     if config is not None:
-        # Model exists - check engine matches if specified
-        if engine and config.get("engine") != engine:
+        # Model exists - check engine matches if specified (aliases allowed)
+        if engine and _canonical_engine(config.get("engine")) != _canonical_engine(engine):
             raise ValueError(
                 f"Model '{model_id}' exists but is for engine '{config['engine']}', "
                 f"not '{engine}'"
             )
         return config
 
-    # Model not found - find similar ones for suggestions
+    # Model not found - build (or reuse) the suggestion message
+    raise ValueError(_model_not_found_message(model_id, engine, _registry_version))
+
+
+@lru_cache(maxsize=256)
+def _model_not_found_message(model_id: str, engine: str | None, version: int) -> str:
+    """Build the validate_model() error message for an unknown model.
+
+    Memoized because fuzzy suggestion search is the expensive part of a miss
+    and callers tend to retry the same typo. Keyed on the registry version
+    and cleared by register_config().
+    """
     similar = find_similar_models(model_id, engine)
+    engine_msg = f" for engine '{engine}'" if engine else ""
 
     if similar:
         # Found similar models - show suggestions
@@ -961,17 +1322,15 @@ def validate_model(model_id: str, engine: Optional[str] = None) -> dict[str, Any
             f"  - {m['id']} ({m['full_name']}) - {m['engine']} - {m['cost']}"
             for m in similar
         )
-        engine_msg = f" for engine '{engine}'" if engine else ""
-        raise ValueError(
+        return (
             f"Model '{model_id}' not found{engine_msg}. Did you mean one of these?\n"
             f"{suggestions}\n\n"
             f"Use: --model <model-id>"
         )
 
     # No similar models found - provide generic help
-    engine_msg = f" for engine '{engine}'" if engine else ""
     engine_filter = f', engine="{engine}"' if engine else ""
-    raise ValueError(
+    return (
         f"Model '{model_id}' not found{engine_msg}.\n\n"
         f"List available models:\n"
         f"  python -c 'from omnai import list_configs; "
@@ -980,6 +1339,15 @@ def validate_model(model_id: str, engine: Optional[str] = None) -> dict[str, Any
     )
 
 
+def _clear_caches() -> None:
+    """Drop memoized query results after the registry changes."""
+    global _registry_version
+    _registry_version += 1
+    _model_not_found_message.cache_clear()
+    _find_config_ids.cache_clear()
+    _similar_model_ids.cache_clear()
+
+
 #------------------------------------------------------------------------------
 # Extension API (for custom models)
 #------------------------------------------------------------------------------
@@ -999,6 +1367,10 @@ def register_config(
     Returns:
         True if registered successfully, False if ID already exists and override=False
 
+    Raises:
+        ValueError: If an indexed field (cost, speed, quality, best_for,
+            free_tier, engine) holds an unhashable value such as a dict
+
     Example:
         >>> register_config("my-model", {
         ...     "engine": "ollama",
@@ -1009,34 +1381,79 @@ def register_config(
         ...     "best_for": ["testing"],
         ... })
     """
-    if model_id in _CUSTOM_CONFIGS and not override:
-        return False
-
-    # Ensure required fields with defaults
-    full_config = {
-        "cost": "medium",
-        "speed": "medium",
-        "quality": "good",
-        "best_for": [],
-        "free_tier": False,
-        "cost_per_mtok": {"input": 0, "output": 0},
-        "notes": "",
-        **config,
-    }
-
-    _CUSTOM_CONFIGS[model_id] = full_config
-    return True
+    with _REGISTRY_LOCK:
+        previous = _CUSTOM_CONFIGS.get(model_id)
+        if previous is not None and not override:
+            return False
+
+        # Ensure required fields with defaults. The stored entry is a frozen
+        # copy, so neither the caller's dict nor returned configs can change
+        # it behind the indexes' back.
+        full_config = _freeze({
+            "cost": "medium",
+            "speed": "medium",
+            "quality": "good",
+            "best_for": [],
+            "free_tier": False,
+            "cost_per_mtok": {"input": 0, "output": 0},
+            "notes": "",
+            **config,
+            "id": model_id,
+        })
+
+        # Check every indexed value before touching any state, so a bad
+        # config can't leave the registry, indexes and caches half-updated
+        for field in _FACET_INDEXES:
+            for value in _facet_values(full_config, field):
+                try:
+                    hash(value)
+                except TypeError:
+                    raise ValueError(
+                        f"Invalid {field} for model '{model_id}': {value!r} "
+                        f"(expected a string, bool or list of strings)"
+                    ) from None
+
+        # Re-index under the new config (it replaces any custom or built-in one)
+        if previous is None:
+            previous = MODEL_CONFIGS.get(model_id)
+        if previous is not None:
+            _unindex_config(model_id, previous)
+
+        _CUSTOM_CONFIGS[model_id] = full_config
+        _MODEL_IDS_LOWER[model_id] = model_id.lower()
+        _MODEL_POSITIONS.setdefault(model_id, len(_MODEL_POSITIONS))
+        _index_config(model_id, full_config)
+        _clear_caches()
+        return True
 
 
 def list_custom_configs() -> list[dict[str, Any]]:
     """List all custom (user-registered) model configurations.
 
     Returns:
-        List of custom model configurations
+        List of custom model configurations (nested values are read-only,
+        as for get_config())
     """
-    configs = []
-    for model_id, config in _CUSTOM_CONFIGS.items():
-        model_config = config.copy()
-        model_config["id"] = model_id
-        configs.append(model_config)
-    return configs
+    return [config.copy() for config in tuple(_CUSTOM_CONFIGS.values())]
+
+
+def _reset_custom_configs() -> None:
+    """Drop all custom configs, restoring the built-in registry and indexes.
+
+    Not part of the public API; used by the test suite to isolate tests.
+    """
+    with _REGISTRY_LOCK:
+        _CUSTOM_CONFIGS.clear()
+
+        # Custom-only IDs were appended after the built-ins
+        for model_id in list(_MODEL_POSITIONS):
+            if model_id not in MODEL_CONFIGS:
+                del _MODEL_POSITIONS[model_id]
+                del _MODEL_IDS_LOWER[model_id]
+
+        for index in _FACET_INDEXES.values():
+            index.clear()
+        for model_id, config in MODEL_CONFIGS.items():
+            _index_config(model_id, config)
+
+        _clear_caches()
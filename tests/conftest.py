@@ -0,0 +1,19 @@
+"""Shared pytest fixtures for the omnai test suite."""
+
+import pytest
+
+from omnai import configs
+
+
+@pytest.fixture(autouse=True)
+def _isolate_custom_configs():
+    """Restore the custom config registry after each test.
+
+    register_config() mutates module-level state; without this, custom
+    models leak between tests and the registry grows across the run.
+    """
+    snapshot = configs.list_custom_configs()
+    yield
+    configs._reset_custom_configs()
+    for config in snapshot:
+        configs.register_config(config["id"], config, override=True)
@@ -1,6 +1,20 @@
 """Tests for omnai.configs module."""
 
+import ast
+import copy
+import json
+import os
+import pickle
+import subprocess
+import sys
+import threading
+import typing
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
 import pytest
+
+import omnai
 from omnai import (
     get_config,
     list_configs,
@@ -10,10 +24,22 @@ from omnai import (
     register_config,
     list_custom_configs,
     find_similar_models,
+    get_model_suggestions,
     validate_model,
     ENGINE_CONFIGS,
     MODEL_CONFIGS,
 )
+from omnai.configs import (
+    _LEVELS,
+    CostLevel,
+    QualityLevel,
+    SpeedLevel,
+    _reset_custom_configs,
+)
+
+VALID_COSTS = frozenset({"free", "cheap", "medium", "expensive"})
+VALID_SPEEDS = frozenset({"very-fast", "fast", "medium", "slow", "very-slow"})
+VALID_QUALITIES = frozenset({"excellent", "good", "fair", "basic"})
 
 
 class TestGetConfig:
@@ -63,6 +89,19 @@ class TestListConfigs:
         configs = list_configs()
         assert all("id" in c for c in configs)
 
+    def test_list_configs_resolves_engine_alias(self):
+        """Test that an engine alias lists the canonical engine's models."""
+        assert list_configs(engine="claude-code") == list_configs(engine="claude")
+        assert list_configs(engine="claude-code")
+
+    def test_list_configs_custom_config_under_alias(self):
+        """Test that custom configs registered under an alias are listed."""
+        register_config("test-alias-engine", {
+            "engine": "claude-code", "model": "alias:1",
+        })
+        assert "test-alias-engine" in [c["id"] for c in list_configs(engine="claude")]
+        assert "test-alias-engine" in [m["id"] for m in find_configs(engine="claude")]
+
 
 class TestFindConfigs:
     """Test find_configs function."""
@@ -125,6 +164,11 @@ class TestFindConfigs:
         assert len(models) > 0
         assert all(m["engine"] in ["claude-code", "claude"] for m in models)
 
+    def test_find_by_engine_alias(self):
+        """Test that an engine alias matches the canonical engine's models."""
+        assert find_configs(engine="claude-code") == find_configs(engine="claude")
+        assert find_configs(engine="claude-code")
+
     def test_find_by_multiple_criteria(self):
         """Test finding configs by multiple criteria."""
         models = find_configs(
@@ -143,6 +187,64 @@ class TestFindConfigs:
         # Should return empty list, not error
         assert models == []
 
+    def test_find_unknown_level_raises(self):
+        """Test that a misspelled level is rejected with the valid choices."""
+        with pytest.raises(ValueError) as exc_info:
+            find_configs(cost="expensve")
+        assert "'expensve'" in str(exc_info.value)
+        assert "expensive" in str(exc_info.value)
+
+    def test_find_accepts_level_used_by_custom_config(self):
+        """Test that levels introduced by custom configs stay queryable."""
+        register_config("test-custom-level", {
+            "engine": "ollama",
+            "model": "level:latest",
+            "cost": "subsidized",
+        }, override=True)
+        models = find_configs(cost="subsidized")
+        assert [m["id"] for m in models] == ["test-custom-level"]
+
+    def test_find_rejects_custom_level_no_longer_used(self):
+        """Test that a custom level is unknown again once nothing uses it."""
+        register_config("test-custom-level", {
+            "engine": "ollama", "model": "level:1", "cost": "subsidized",
+        }, override=True)
+        register_config("test-custom-level", {
+            "engine": "ollama", "model": "level:2", "cost": "free",
+        }, override=True)
+        with pytest.raises(ValueError):
+            find_configs(cost="subsidized")
+
+    def test_find_repeated_query_returns_fresh_copies(self):
+        """Test that repeated (cached) queries don't share result dicts."""
+        first = find_configs(engine="ollama")
+        first[0]["cost"] = "mutated"
+        second = find_configs(engine="ollama")
+        assert second[0]["cost"] != "mutated"
+        assert [m["id"] for m in first] == [m["id"] for m in second]
+
+    def test_find_reflects_overridden_custom_config(self):
+        """Test that overriding a custom config updates filter results."""
+        register_config("test-find-override", {
+            "engine": "ollama",
+            "model": "find:1",
+            "cost": "free",
+            "best_for": ["find-probe"],
+        }, override=True)
+        assert [m["id"] for m in find_configs(best_for="find-probe")] == [
+            "test-find-override"
+        ]
+
+        register_config("test-find-override", {
+            "engine": "ollama",
+            "model": "find:2",
+            "cost": "cheap",
+            "best_for": ["find-probe"],
+        }, override=True)
+        assert find_configs(cost="free", best_for="find-probe") == []
+        models = find_configs(cost="cheap", best_for="find-probe")
+        assert [m["model"] for m in models] == ["find:2"]
+
 
 class TestGetDefaultModel:
     """Test get_default_model function."""
@@ -218,6 +320,105 @@ class TestRegisterConfig:
         )
         assert success is True
 
+    def test_register_copies_nested_values(self):
+        """Test that the caller's lists stay decoupled from the stored config."""
+        best_for = ["testing"]
+        register_config("test-nested", {
+            "engine": "ollama", "model": "n:1", "best_for": best_for,
+        })
+        best_for.append("zzz-late")
+
+        assert get_config("test-nested")["best_for"] == ["testing"]
+        assert find_configs(best_for="zzz-late") == []
+
+    def test_register_unhashable_value_leaves_registry_intact(self):
+        """Test that a rejected override changes neither config nor indexes."""
+        register_config("test-atomic", {
+            "engine": "ollama", "model": "a:1", "best_for": ["atomic-probe"],
+        })
+        assert [m["id"] for m in find_configs(best_for="atomic-probe")] == ["test-atomic"]
+
+        with pytest.raises(ValueError, match="cost"):
+            register_config("test-atomic", {
+                "engine": "ollama", "model": "a:2", "cost": {"input": 1},
+            }, override=True)
+
+        assert get_config("test-atomic")["model"] == "a:1"
+        assert [m["id"] for m in find_configs(best_for="atomic-probe")] == ["test-atomic"]
+
+    def test_register_concurrently(self):
+        """Test that concurrent registrations all end up queryable."""
+        model_ids = [f"test-concurrent-{i}" for i in range(40)]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(
+                lambda mid: register_config(
+                    mid, {"engine": "ollama", "model": mid, "best_for": ["concurrency"]}
+                ),
+                model_ids,
+            ))
+
+        assert all(results)
+        found = {c["id"] for c in find_configs(best_for="concurrency")}
+        assert found == set(model_ids)
+
+    def test_queries_during_registration(self):
+        """Test that queries running alongside registrations never fail or go stale."""
+        model_ids = [f"test-racing-{i}" for i in range(300)]
+        queries = (
+            lambda: find_similar_models("test-racing-1"),
+            lambda: find_similar_models("test-racing-1", engine="ollama"),
+            lambda: find_configs(),
+            lambda: find_configs(best_for="racing"),
+            lambda: list_configs("ollama"),
+            list_custom_configs,
+            lambda: get_model_suggestions(engine="ollama", limit=None),
+        )
+        errors = []
+        done = threading.Event()
+
+        def query_loop():
+            try:
+                while not done.is_set():
+                    for query in queries:
+                        query()
+            except Exception as e:  # noqa: BLE001 - reported below
+                errors.append(e)
+
+        # Switch threads far more often than the default 5 ms to provoke races
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        readers = [threading.Thread(target=query_loop) for _ in range(4)]
+        for reader in readers:
+            reader.start()
+        try:
+            for model_id in model_ids:
+                register_config(
+                    model_id, {"engine": "ollama", "model": model_id, "best_for": ["racing"]}
+                )
+        finally:
+            done.set()
+            for reader in readers:
+                reader.join()
+            sys.setswitchinterval(switch_interval)
+
+        assert errors == []
+        # Memoized results computed mid-registration must not outlive it
+        assert [c["id"] for c in find_configs(best_for="racing")] == model_ids
+        similar = find_similar_models("test-racing", limit=len(model_ids))
+        assert [m["id"] for m in similar] == model_ids
+
+    def test_reset_restores_builtin_registry(self):
+        """Test that resetting custom configs restores built-in query results."""
+        before = find_configs(engine="ollama")
+        register_config("gpt-4o", {"engine": "ollama", "model": "shadow:latest"})
+        register_config("test-reset-only", {"engine": "ollama", "model": "r:1"})
+
+        _reset_custom_configs()
+
+        assert list_custom_configs() == []
+        assert find_configs(engine="ollama") == before
+        assert find_similar_models("test-reset-only") == []
+
 
 class TestListCustomConfigs:
     """Test list_custom_configs function."""
@@ -235,7 +436,8 @@ class TestListCustomConfigs:
 class TestModelConfigs:
     """Test MODEL_CONFIGS structure."""
 
-    def test_all_configs_have_required_fields(self):
+    @pytest.mark.parametrize("model_id", MODEL_CONFIGS)
+    def test_all_configs_have_required_fields(self, model_id):
         """Test that all configs have required fields."""
         required_fields = [
             "engine", "model", "full_name", "context_window",
@@ -243,42 +445,112 @@ class TestModelConfigs:
             "cost_per_mtok", "notes"
         ]
 
-        for model_id, config in MODEL_CONFIGS.items():
-            for field in required_fields:
-                assert field in config, f"{model_id} missing {field}"
+        config = MODEL_CONFIGS[model_id]
+        for field in required_fields:
+            assert field in config, f"{model_id} missing {field}"
+
+    def test_levels_match_valid_values(self):
+        """Test that find_configs() validates against the expected levels."""
+        assert frozenset(_LEVELS["cost"]) == VALID_COSTS
+        assert frozenset(_LEVELS["speed"]) == VALID_SPEEDS
+        assert frozenset(_LEVELS["quality"]) == VALID_QUALITIES
 
-    def test_cost_valid_values(self):
+    @pytest.mark.parametrize("model_id", MODEL_CONFIGS)
+    def test_cost_valid_values(self, model_id):
         """Test that cost field has valid values."""
-        valid_costs = ["free", "cheap", "medium", "expensive"]
-        for model_id, config in MODEL_CONFIGS.items():
-            assert config["cost"] in valid_costs, f"{model_id} has invalid cost"
+        assert MODEL_CONFIGS[model_id]["cost"] in VALID_COSTS, f"{model_id} has invalid cost"
 
-    def test_speed_valid_values(self):
+    @pytest.mark.parametrize("model_id", MODEL_CONFIGS)
+    def test_speed_valid_values(self, model_id):
         """Test that speed field has valid values."""
-        valid_speeds = ["very-fast", "fast", "medium", "slow", "very-slow"]
-        for model_id, config in MODEL_CONFIGS.items():
-            assert config["speed"] in valid_speeds, f"{model_id} has invalid speed"
+        assert MODEL_CONFIGS[model_id]["speed"] in VALID_SPEEDS, f"{model_id} has invalid speed"
 
-    def test_quality_valid_values(self):
+    @pytest.mark.parametrize("model_id", MODEL_CONFIGS)
+    def test_quality_valid_values(self, model_id):
         """Test that quality field has valid values."""
-        valid_qualities = ["excellent", "good", "fair", "basic"]
-        for model_id, config in MODEL_CONFIGS.items():
-            assert config["quality"] in valid_qualities, f"{model_id} has invalid quality"
+        assert MODEL_CONFIGS[model_id]["quality"] in VALID_QUALITIES, f"{model_id} has invalid quality"
 
-    def test_cost_per_mtok_structure(self):
+    @pytest.mark.parametrize("model_id", MODEL_CONFIGS)
+    def test_cost_per_mtok_structure(self, model_id):
         """Test that cost_per_mtok has correct structure."""
-        for model_id, config in MODEL_CONFIGS.items():
-            cost = config["cost_per_mtok"]
-            assert "input" in cost, f"{model_id} missing input cost"
-            assert "output" in cost, f"{model_id} missing output cost"
-            assert isinstance(cost["input"], (int, float))
-            assert isinstance(cost["output"], (int, float))
-
-    def test_best_for_is_list(self):
+        cost = MODEL_CONFIGS[model_id]["cost_per_mtok"]
+        assert "input" in cost, f"{model_id} missing input cost"
+        assert "output" in cost, f"{model_id} missing output cost"
+        assert isinstance(cost["input"], (int, float))
+        assert isinstance(cost["output"], (int, float))
+
+    def test_registry_is_read_only(self):
+        """Test that built-in configs cannot be mutated in place."""
+        with pytest.raises(TypeError):
+            MODEL_CONFIGS["new-model"] = {"engine": "ollama"}
+        with pytest.raises(TypeError):
+            MODEL_CONFIGS["gpt-4o"]["cost"] = "free"
+        with pytest.raises(TypeError):
+            ENGINE_CONFIGS["ollama"]["default_model"] = "mistral"
+        with pytest.raises(TypeError):
+            MODEL_CONFIGS["gpt-4o"]["cost_per_mtok"]["input"] = 999
+        with pytest.raises(TypeError):
+            MODEL_CONFIGS["gpt-4o"]["best_for"].append("zzz-tag")
+        with pytest.raises(TypeError):
+            MODEL_CONFIGS["gpt-4o"]["best_for"][0] = "zzz-tag"
+        with pytest.raises(TypeError):
+            ENGINE_CONFIGS["claude"]["aliases"].append("zzz-alias")
+
+    def test_returned_configs_are_detached(self):
+        """Test that editing a returned config leaves the registry intact."""
+        config = get_config("gpt-4o")
+        config["cost"] = "free"
+        with pytest.raises(TypeError):
+            config["best_for"].append("zzz-tag")
+        with pytest.raises(TypeError):
+            config["cost_per_mtok"]["input"] = 999
+
+        assert get_config("gpt-4o")["cost"] != "free"
+        assert find_configs(best_for="zzz-tag") == []
+
+    def test_registry_values_copy_as_plain_data(self):
+        """Test that copy.copy() of nested values returns mutable builtins."""
+        best_for = copy.copy(MODEL_CONFIGS["gpt-4o"]["best_for"])
+        cost = copy.copy(MODEL_CONFIGS["gpt-4o"]["cost_per_mtok"])
+        best_for.append("zzz-tag")
+        cost["input"] = 999
+
+        assert type(best_for) is list and type(cost) is dict
+        assert "zzz-tag" not in MODEL_CONFIGS["gpt-4o"]["best_for"]
+
+    def test_registry_values_deepcopy_as_plain_data(self):
+        """Test that copy.deepcopy() of a config returns mutable builtins."""
+        config = copy.deepcopy(get_config("gpt-4o"))
+        config["best_for"].append("zzz-tag")
+        config["cost_per_mtok"]["input"] = 999
+
+        assert type(config["best_for"]) is list
+        assert MODEL_CONFIGS["gpt-4o"]["cost_per_mtok"]["input"] != 999
+
+        entry = copy.deepcopy(dict(MODEL_CONFIGS["gpt-4o"]))
+        assert type(entry["cost_per_mtok"]) is dict
+        assert entry == MODEL_CONFIGS["gpt-4o"]
+
+    def test_registry_values_pickle_as_plain_data(self):
+        """Test that pickling a config round-trips to mutable builtins."""
+        config = pickle.loads(pickle.dumps(get_config("gpt-4o")))
+
+        assert config == get_config("gpt-4o")
+        assert type(config["best_for"]) is list
+        assert type(config["cost_per_mtok"]) is dict
+
+    def test_registry_values_are_json_serializable(self):
+        """Test that registry entries and returned configs serialize to JSON."""
+        entry = json.loads(json.dumps(MODEL_CONFIGS["gpt-4o"]))
+        assert entry == MODEL_CONFIGS["gpt-4o"]
+        assert json.loads(json.dumps(list_engines()))[0]["id"]
+
+    @pytest.mark.parametrize("model_id", MODEL_CONFIGS)
+    def test_best_for_is_list(self, model_id):
         """Test that best_for is a list."""
-        for model_id, config in MODEL_CONFIGS.items():
-            assert isinstance(config["best_for"], list), f"{model_id} best_for not list"
-            assert len(config["best_for"]) > 0, f"{model_id} best_for is empty"
+        best_for = MODEL_CONFIGS[model_id]["best_for"]
+        assert isinstance(best_for, list), f"{model_id} best_for not list"
+        assert len(best_for) > 0, f"{model_id} best_for is empty"
 
 
 class TestEngineConfigs:
@@ -299,10 +571,9 @@ class TestEngineConfigs:
             # Skip engines with no default model (configured externally)
             if default is None:
                 continue
-            # Find at least one model with this ID
-            assert any(
-                m_id == default for m_id in MODEL_CONFIGS.keys()
-            ), f"Default model {default} for {engine_id} not found"
+            assert default in MODEL_CONFIGS, (
+                f"Default model {default} for {engine_id} not found"
+            )
 
 
 class TestFindSimilarModels:
@@ -347,6 +618,46 @@ class TestFindSimilarModels:
             assert "engine" in model
             assert "cost" in model
 
+    def test_find_similar_refreshes_after_register(self):
+        """Test that repeated searches pick up newly registered models."""
+        assert find_similar_models("zz-similar-probe") == []
+
+        register_config("zz-similar-probe-model", {
+            "engine": "ollama",
+            "model": "probe:latest",
+        }, override=True)
+
+        similar = find_similar_models("zz-similar-probe")
+        assert [m["id"] for m in similar] == ["zz-similar-probe-model"]
+
+
+class TestGetModelSuggestions:
+    """Test get_model_suggestions function."""
+
+    def test_suggestions_respect_limit(self):
+        """Test that listing suggestions stops at the limit."""
+        suggestions = get_model_suggestions(engine="ollama", limit=2)
+        assert [s["id"] for s in suggestions] == [
+            c["id"] for c in list_configs(engine="ollama")[:2]
+        ]
+
+    def test_similar_suggestions_resolve_engine_alias(self):
+        """Test that typo suggestions accept an engine alias."""
+        assert get_model_suggestions("sonnet", engine="claude-code") == get_model_suggestions(
+            "sonnet", engine="claude"
+        )
+        assert find_similar_models("sonnet", engine="claude-code")
+
+    def test_suggestions_resolve_engine_alias(self):
+        """Test that an engine alias lists the canonical engine's models."""
+        assert get_model_suggestions(engine="claude-code") == get_model_suggestions(engine="claude")
+        assert get_model_suggestions(engine="claude-code")
+
+    def test_suggestions_without_limit(self):
+        """Test that limit=None lists every model for the engine."""
+        suggestions = get_model_suggestions(engine="ollama", limit=None)
+        assert len(suggestions) == len(list_configs(engine="ollama"))
+
 
 class TestValidateModel:
     """Test validate_model function."""
@@ -363,6 +674,20 @@ class TestValidateModel:
         config = validate_model("claude-sonnet-4-20250514", engine="claude")
         assert config["engine"] == "claude"
 
+    def test_validate_with_engine_alias(self):
+        """Test validation accepts an engine alias (claude-code -> claude)."""
+        config = validate_model("claude-sonnet-4-20250514", engine="claude-code")
+        assert config["engine"] == "claude"
+
+    def test_validate_typo_with_engine_alias(self):
+        """Test that a typo under an engine alias still gets suggestions."""
+        with pytest.raises(ValueError) as exc_info:
+            validate_model("claude-sonet", engine="claude-code")
+        message = str(exc_info.value)
+        assert "for engine 'claude-code'" in message
+        assert "Did you mean" in message
+        assert "claude-sonnet-4-20250514" in message
+
     def test_validate_with_engine_mismatch(self):
         """Test validation fails with mismatched engine."""
         with pytest.raises(ValueError) as exc_info:
@@ -418,3 +743,82 @@ class TestValidateModel:
         config = validate_model("test-validate-custom")
         assert config is not None
         assert config["engine"] == "ollama"
+
+    def test_validate_suggestions_refresh_after_register(self):
+        """Test that cached miss suggestions pick up newly registered models."""
+        with pytest.raises(ValueError) as exc_info:
+            validate_model("zz-cache-probe")
+        assert "zz-cache-probe-model" not in str(exc_info.value)
+
+        register_config("zz-cache-probe-model", {
+            "engine": "ollama",
+            "model": "probe:latest",
+        }, override=True)
+
+        with pytest.raises(ValueError) as exc_info:
+            validate_model("zz-cache-probe")
+        assert "zz-cache-probe-model" in str(exc_info.value)
+
+
+class TestPackageNamespace:
+    """Test the lazily populated omnai package namespace."""
+
+    def test_configs_submodule_reachable_from_fresh_import(self):
+        """Test omnai.configs works without importing it explicitly first."""
+        code = (
+            "import sys\n"
+            "import omnai\n"
+            "assert omnai.configs.get_config('gpt-4o')['id'] == 'gpt-4o'\n"
+            "assert 'configs' in dir(omnai)\n"
+            "assert 'TYPE_CHECKING' not in dir(omnai)\n"
+            "assert 'TYPE_CHECKING' not in dir(omnai.configs)\n"
+            "assert 'typing' not in sys.modules\n"
+        )
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, env=env
+        )
+        assert result.returncode == 0, result.stderr
+
+
+class TestTypeAnnotations:
+    """Test the runtime view of the configs type annotations."""
+
+    def test_level_aliases_match_levels(self):
+        """Test that the Literal level aliases are built from _LEVELS."""
+        assert typing.get_args(CostLevel) == _LEVELS["cost"]
+        assert typing.get_args(SpeedLevel) == _LEVELS["speed"]
+        assert typing.get_args(QualityLevel) == _LEVELS["quality"]
+
+    def test_static_level_aliases_match_levels(self):
+        """Test that the TYPE_CHECKING Literal aliases list the _LEVELS values."""
+        tree = ast.parse(Path(omnai.configs.__file__).read_text())
+        static = {
+            node.targets[0].id: tuple(
+                elt.value for elt in node.value.slice.elts
+            )
+            for node in ast.walk(tree)
+            if isinstance(node, ast.Assign)
+            and isinstance(node.targets[0], ast.Name)
+            and node.targets[0].id.endswith("Level")
+        }
+        assert static == {
+            "CostLevel": _LEVELS["cost"],
+            "SpeedLevel": _LEVELS["speed"],
+            "QualityLevel": _LEVELS["quality"],
+        }
+
+    def test_star_import_exports_level_aliases(self):
+        """Test that `from omnai.configs import *` includes the aliases."""
+        namespace = {}
+        exec("from omnai.configs import *", namespace)
+        assert namespace["CostLevel"] is CostLevel
+        assert namespace["get_config"] is get_config
+
+    @pytest.mark.parametrize(
+        "name", [name for name in omnai.__all__ if callable(getattr(omnai, name))]
+    )
+    def test_public_type_hints_resolve(self, name):
+        """Test that get_type_hints() works on public functions."""
+        hints = typing.get_type_hints(getattr(omnai, name))
+        assert "return" in hints
@@ -1,9 +1,13 @@
 # AI Runner Integration Tests
 # Tests that actually call AI backends (requires installed engines)
 
+import functools
+import json
 import subprocess
 import tempfile
 import os
+import unittest
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 AI_RUNNER = Path(__file__).parent.parent / "ai-runner.sh"
@@ -18,57 +22,59 @@ def run_ai(prompt):
     )
     return result.stdout.strip(), result.returncode
 
-def test_ai_available():
-    """Check if any AI backend is available."""
+@functools.lru_cache(maxsize=1)
+def _ai_available():
+    """Probe installed engines once; the answer can't change mid-run."""
     result = subprocess.run(
         ["bash", str(AI_RUNNER), "--list-engines"],
         capture_output=True,
-        text=True
     )
-    return "installed" in result.stdout
+    return b"installed" in result.stdout  # Only a marker check; skip decoding
+
+def _require_ai():
+    """Skip the calling test when no AI engine is installed.
+
+    Raises unittest.SkipTest, which pytest reports as a skip, so script
+    mode below keeps working without pytest installed.
+    """
+    if not _ai_available():
+        raise unittest.SkipTest("No AI engine available")
+
+def test_ai_available():
+    """Check if any AI backend is available."""
+    _require_ai()
 
 def test_simple_prompt():
     """Test a simple prompt."""
-    if not test_ai_available():
-        print("SKIP: No AI engine available")
-        return
+    _require_ai()
 
     output, code = run_ai("Say 'Hello from test' exactly")
     assert code == 0, f"Exit code {code}"
     assert "Hello from test" in output, f"Expected greeting in: {output}"
-    print(f"PASS: Simple prompt returned: {output[:50]}")
 
 def test_json_response():
     """Test JSON response format."""
-    if not test_ai_available():
-        print("SKIP: No AI engine available")
-        return
+    _require_ai()
 
     output, code = run_ai('List 3 colors as JSON: {"colors": ["red", "green", "blue"]}')
     assert code == 0, f"Exit code {code}"
     # Should be parseable JSON
-    import json
     try:
         data = json.loads(output)
-        assert "colors" in data
-        print(f"PASS: JSON response parsed successfully")
     except json.JSONDecodeError:
-        # AI might have added explanation
-        if "red" in output and "green" in output:
-            print(f"PASS: JSON response contains expected data")
-        else:
-            print(f"WARN: JSON parse failed but response: {output[:100]}")
+        # AI might have added explanation around the JSON
+        assert "red" in output and "green" in output, f"Unexpected response: {output[:100]}"
+    else:
+        assert "colors" in data, f"No colors key in: {data}"
 
 def test_timeout():
     """Test that timeout works."""
     # This would require a very long response to properly test
-    print("INFO: Timeout test requires long-running prompts")
+    raise unittest.SkipTest("Timeout test requires long-running prompts")
 
 def test_template_prompt():
     """Test prompt from template."""
-    if not test_ai_available():
-        print("SKIP: No AI engine available")
-        return
+    _require_ai()
 
     with tempfile.TemporaryDirectory() as tmpdir:
         template = Path(tmpdir) / "test.md"
@@ -82,23 +88,30 @@ def test_template_prompt():
             timeout=60
         )
 
-        if result.returncode == 0:
-            print(f"PASS: Template file executed")
-        else:
-            # Might fail if NAME/COUNT not substituted
-            print(f"INFO: Template test - exit code {result.returncode}")
+        assert result.returncode == 0, (
+            f"Exit code {result.returncode}: {result.stderr[:200]}"
+        )
 
 if __name__ == "__main__":
     print("AI Runner Integration Tests")
     print("=" * 40)
 
-    test_ai_available()
+    _ai_available()  # Probe once before the tests run concurrently
 
     print("\n--- Integration Tests ---\n")
 
-    test_simple_prompt()
-    test_json_response()
-    test_template_prompt()
+    # Independent and network-bound: run them side by side. One worker per
+    # test also caps concurrent calls to the provider at three.
+    tests = [test_simple_prompt, test_json_response, test_template_prompt]
+    with ThreadPoolExecutor(max_workers=len(tests)) as pool:
+        futures = [pool.submit(test) for test in tests]
+    for test, future in zip(tests, futures):
+        try:
+            future.result()  # Re-raise assertion failures
+        except unittest.SkipTest as exc:
+            print(f"SKIP: {test.__name__}: {exc}")
+        else:
+            print(f"PASS: {test.__name__}")
 
     print("\n" + "=" * 40)
     print("Integration tests complete")